@@ -14,7 +14,7 @@
 # In[1]:
 
 
-import pandas as pd
+import functools
 import numpy as np
 
 
@@ -28,7 +28,7 @@ import numpy as np
 
 
 #NZ and AS wind regions
-table3_1_b = pd.DataFrame([
+table3_1_b = dict([
 ["Adelaide", 'A1',],
 ["Albany", 'A1',],
 ["Albury/Wodonga", 'A1',],
@@ -114,9 +114,7 @@ table3_1_b = pd.DataFrame([
 ["Heard Island", 'A1',],
 ["Lord Howe Island", 'A1',],
 ["Macquarie Island", 'A1',],
-["Norfolk Island", 'B',],],
-columns = ["Location","Wind Region"]                       
-)
+["Norfolk Island", 'B',],])
 
 
 #table3_1_b
@@ -126,8 +124,10 @@ columns = ["Location","Wind Region"]
 
 # In[3]:
 
+table3_1_regions = ["A1", "A2", "A3", "A4", "A5", "A6", "A7", "W", "B", "C", "D"]
+
 # for R< 50 years
-table3_1 = pd.DataFrame([
+table3_1 = {row[0]: dict(zip(table3_1_regions, row[1:])) for row in [
 ['1/25', 37, 37, 37, 37, 37, 37, 37, 43, 39, 47, 53],   
 ['1/50', 39, 39, 39, 39, 39, 39, 39, 45, 44, 52, 60],
 ['1/100', 41, 41, 41, 41, 41, 41, 41, 47, 48, 56, 66],
@@ -136,12 +136,10 @@ table3_1 = pd.DataFrame([
 ['1/500', 45, 45, 45, 45, 45, 45, 45, 51, 57, 66, 80],
 ['1/1000', 46, 46, 46, 46, 46, 46, 46, 53, 60, 70, 85],
 ['1/2000', 48, 48, 48, 48, 48, 48, 48, 54, 63, 73, 90],
-['1/2500', 48, 48, 48, 48, 48, 48, 48, 55, 64, 74, 91]],
-columns = ["V value", "A1", "A2", "A3", "A4", "A5","A6", "A7", "W", "B", "C", "D"]
-)
+['1/2500', 48, 48, 48, 48, 48, 48, 48, 55, 64, 74, 91]]}
 
 # for R>= 50 years
-table3_1_50 = pd.DataFrame([
+table3_1_50 = {row[0]: dict(zip(table3_1_regions, row[1:])) for row in [
 ['1/25', 37, 37, 37, 37, 37, 37, 37, 43, 39, 49.35, 58.3],   
 ['1/50', 39, 39, 39, 39, 39, 39, 39, 45, 44, 54.6, 66],
 ['1/100', 41, 41, 41, 41, 41, 41, 41, 47, 48, 58.8, 72.6],
@@ -150,24 +148,23 @@ table3_1_50 = pd.DataFrame([
 ['1/500', 45, 45, 45, 45, 45, 45, 45, 51, 57, 69.3, 88],
 ['1/1000', 46, 46, 46, 46, 46, 46, 46, 53, 60, 73.5, 93.5],
 ['1/2000', 48, 48, 48, 48, 48, 48, 48, 54, 63, 76.65, 99],
-['1/2500', 48, 48, 48, 48, 48, 48, 48, 55, 64, 77.7, 100.1]],
-columns = ["V value", "A1", "A2", "A3", "A4", "A5","A6", "A7", "W", "B", "C", "D"]
-)
+['1/2500', 48, 48, 48, 48, 48, 48, 48, 55, 64, 77.7, 100.1]]}
 
 # In[4]:
 
 
 def location_wind_region(location):
-    return table3_1_b[table3_1_b["Location"] == location]["Wind Region"].values[0]
+    return table3_1_b[location]
 
+@functools.cache
 def wind_region_speed(p, location, design_working_life):
     location_region = location_wind_region(location)
     design_working_life = design_working_life.split()
     year = int(design_working_life[0])
     if year < 50:
-        wind_region_speed = table3_1[table3_1["V value"] == p][location_region].values[0]
+        wind_region_speed = table3_1[p][location_region]
     else:
-        wind_region_speed = table3_1_50[table3_1_50["V value"] == p][location_region].values[0]
+        wind_region_speed = table3_1_50[p][location_region]
     return wind_region_speed
 
 
@@ -185,7 +182,9 @@ def wind_region_speed(p, location, design_working_life):
 # In[6]:
 
 
-Table4_1 = pd.DataFrame([
+Table4_1 = dict(zip(
+    ["Height", "TC1", "TC1.5", "TC2", "TC2.5", "TC3", "TC4"],
+    np.array([
     [3, 0.99, 0.95, 0.91, 0.87, 0.83, 0.75],
     [5, 1.05, 0.98, 0.91, 0.87, 0.83, 0.75],
     [10, 1.12, 1.06, 1, 0.915, 0.83, 0.75],
@@ -197,9 +196,8 @@ Table4_1 = pd.DataFrame([
     [75, 1.27, 1.245, 1.22, 1.17, 1.12, 0.98],
     [100, 1.29, 1.265, 1.24, 1.2, 1.16, 1.03],
     [150, 1.31, 1.29, 1.27, 1.24, 1.21, 1.11],
-    [200, 1.32, 1.305, 1.29, 1.265, 1.24, 1.16]],
-    columns = ["Height", "TC1", "TC1.5", "TC2", "TC2.5", "TC3", "TC4"]
-)
+    [200, 1.32, 1.305, 1.29, 1.265, 1.24, 1.16]], dtype=np.float64).T.copy()
+))
 
 #Table4_1
     
@@ -208,22 +206,9 @@ Table4_1 = pd.DataFrame([
 # In[7]:
 
 
-def interpolation(height):
-    indices = Table4_1['Height'].searchsorted([height], side='right')
-    lower_bound_index = indices[0] - 1
-    upper_bound_index = indices[0] if indices[0] != len(Table4_1) else indices[0] - 1
-    height_low = Table4_1['Height'][lower_bound_index]
-    height_high = Table4_1['Height'][upper_bound_index]
-    interpolation_hn = (height - height_low) / (height_high - height_low)
-    return interpolation_hn, lower_bound_index, upper_bound_index
-
 def Mz_cat(height, Terrain_category):
-    interpolation_height, lower_bound_index, upper_bound_index = interpolation(height)
-    mz_cat_low = Table4_1[Terrain_category][lower_bound_index]
-    mz_cat_high = Table4_1[Terrain_category][upper_bound_index]
-    Mz_cat = mz_cat_low + interpolation_height * (mz_cat_high - mz_cat_low)
-    
-    return Mz_cat
+    #linear interpolation, clamped to the 3 m and 200 m rows; height may be a scalar or an array
+    return np.interp(height, Table4_1['Height'], Table4_1[Terrain_category])
     
 
 
@@ -246,6 +231,20 @@ def site_wind_speed(p, location, design_working_life, height, Terrain_category):
     
     return Vr * Md * (Mz_cat_value * Ms * Mt)
 
+def make_site_wind_speed(location, design_working_life):
+    
+    Md = 1.0 #wind_direction_multiplier
+    Ms = 1.0 #shielding_multiplier
+    Mt = 1.0 #topographic_multiplier
+    
+    #Regional speeds for this site, pre-scaled by the height-independent multipliers
+    site_region_speeds = {p: wind_region_speed(p, location, design_working_life) * Md * Ms * Mt for p in table3_1}
+    
+    def site_wind_speed_at(p, height, Terrain_category):
+        return site_region_speeds[p] * Mz_cat(height, Terrain_category)
+    
+    return site_wind_speed_at
+
 
 # In[10]:
 
@@ -260,6 +259,7 @@ def site_wind_speed(p, location, design_working_life, height, Terrain_category):
 
 
 def calc_wind_pressure(v_site):
+    #v_site may be a single speed or a numpy array, e.g. from site_wind_speed over an array of heights
     
     partition_overall_pressure_factor = 0.4
     #Density of air (kg/m3)
@@ -12,7 +12,6 @@
 # In[1]:
 
 
-import pandas as pd
 import numpy as np
 
 
@@ -26,7 +25,7 @@ import numpy as np
 
 
 
-table3_1_b = pd.DataFrame([
+table3_1_b = dict([
 ['Akaroa','A7',],
 ['Alexandra','A7',],
 ['Arrowtown','A7',],
@@ -155,9 +154,7 @@ table3_1_b = pd.DataFrame([
 ['Whakatane','A7',],
 ['Whangarei','A6',],
 ['Winton','A7',],
-['Woodville','A7',]],
-columns = ["Location","Wind Region"]                       
-)
+['Woodville','A7',]])
 
 
 #table3_1_b
@@ -168,7 +165,9 @@ columns = ["Location","Wind Region"]
 # In[3]:
 
 
-table3_1 = pd.DataFrame([
+table3_1_regions = ["A6", "A7", "W"]
+
+table3_1 = {row[0]: dict(zip(table3_1_regions, row[1:])) for row in [
 ['1/25', 37, 37, 43],
 ['1/50', 39, 39, 45],
 ['1/100', 41, 41, 47],
@@ -177,20 +176,18 @@ table3_1 = pd.DataFrame([
 ['1/500', 45, 45, 51],
 ['1/1000', 46, 46, 53],
 ['1/2000', 48, 48, 54],
-['1/2500', 48, 48, 55]],
-columns = ["V value", "A6", "A7", "W"]
-)
+['1/2500', 48, 48, 55]]}
 
 
 # In[4]:
 
 
 def location_wind_region(location):
-    return table3_1_b[table3_1_b["Location"] == location]["Wind Region"].values[0]
+    return table3_1_b[location]
 
 def wind_region_speed(p, location):
     location_region = location_wind_region(location)
-    return table3_1[table3_1["V value"] == p][location_region].values[0]
+    return table3_1[p][location_region]
 
 
 # In[5]:
@@ -207,7 +204,9 @@ def wind_region_speed(p, location):
 # In[6]:
 
 
-Table4_1 = pd.DataFrame([
+Table4_1 = dict(zip(
+    ["Height", "TC1", "TC1.5", "TC2", "TC2.5", "TC3", "TC4"],
+    np.array([
     [3, 0.99, 0.95, 0.91, 0.87, 0.83, 0.75],
     [5, 1.05, 0.98, 0.91, 0.87, 0.83, 0.75],
     [10, 1.12, 1.06, 1, 0.915, 0.83, 0.75],
@@ -219,9 +218,8 @@ Table4_1 = pd.DataFrame([
     [75, 1.27, 1.245, 1.22, 1.17, 1.12, 0.98],
     [100, 1.29, 1.265, 1.24, 1.2, 1.16, 1.03],
     [150, 1.31, 1.29, 1.27, 1.24, 1.21, 1.11],
-    [200, 1.32, 1.305, 1.29, 1.265, 1.24, 1.16]],
-    columns = ["Height", "TC1", "TC1.5", "TC2", "TC2.5", "TC3", "TC4"]
-)
+    [200, 1.32, 1.305, 1.29, 1.265, 1.24, 1.16]], dtype=np.float64).T.copy()
+))
 
 #Table4_1
     
@@ -230,25 +228,9 @@ Table4_1 = pd.DataFrame([
 # In[7]:
 
 
-def interpolation(height):
-    indices = Table4_1['Height'].searchsorted([height], side='right')
-    lower_bound_index = indices[0] - 1
-    upper_bound_index = indices[0] if indices[0] != len(Table4_1) else indices[0] - 1
-    height_low = Table4_1['Height'][lower_bound_index]
-    height_high = Table4_1['Height'][upper_bound_index]
-    interpolation_hn = (height - height_low) / (height_high - height_low)
-    return interpolation_hn, lower_bound_index, upper_bound_index
-
 def Mz_cat(height, Terrain_category):
-    if height <= 3:
-        Mz_cat = Table4_1[Terrain_category][0]
-    else:
-        interpolation_height, lower_bound_index, upper_bound_index = interpolation(height)
-        mz_cat_low = Table4_1[Terrain_category][lower_bound_index]
-        mz_cat_high = Table4_1[Terrain_category][upper_bound_index]
-        Mz_cat = mz_cat_low + interpolation_height * (mz_cat_high - mz_cat_low)
-    
-    return Mz_cat
+    #linear interpolation, clamped to the 3 m and 200 m rows; height may be a scalar or an array
+    return np.interp(height, Table4_1['Height'], Table4_1[Terrain_category])
     
 
 
@@ -271,6 +253,20 @@ def site_wind_speed(p, location, height, Terrain_category):
     v_site = Vr * Md * (Mz_cat_value * Ms * Mt)
     return v_site
 
+def make_site_wind_speed(location):
+    
+    Md = 1.0 #wind_direction_multiplier
+    Ms = 1.0 #shielding_multiplier
+    Mt = 1.0 #topographic_multiplier
+    
+    #Regional speeds for this site, pre-scaled by the height-independent multipliers
+    site_region_speeds = {p: wind_region_speed(p, location) * Md * Ms * Mt for p in table3_1}
+    
+    def site_wind_speed_at(p, height, Terrain_category):
+        return site_region_speeds[p] * Mz_cat(height, Terrain_category)
+    
+    return site_wind_speed_at
+
 
 # In[10]:
 
@@ -285,6 +281,7 @@ def site_wind_speed(p, location, height, Terrain_category):
 
 
 def calc_wind_pressure(v_site):
+    #v_site may be a single speed or a numpy array, e.g. from site_wind_speed over an array of heights
     
     partition_overall_pressure_factor = 0.4
     #Density of air (kg/m3)